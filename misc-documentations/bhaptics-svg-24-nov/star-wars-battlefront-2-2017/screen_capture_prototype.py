@@ -5,7 +5,7 @@ This script captures screen edges and detects the red damage indicator,
 then writes events to a file for the Python daemon to process.
 
 Requirements:
-    pip install mss pillow numpy
+    pip install mss numpy pygetwindow
 
 Usage:
     python screen_capture_prototype.py
@@ -13,12 +13,19 @@ Usage:
 
 import mss
 import numpy as np
-from PIL import Image
 import time
 import os
+import atexit
 import json
+import queue
+import threading
 from pathlib import Path
 
+try:
+    import pygetwindow as gw
+except ImportError:
+    gw = None
+
 # Default configuration (used if config file not found)
 DEFAULT_CONFIG = {
     "edge_width": 20,
@@ -28,6 +35,9 @@ DEFAULT_CONFIG = {
     "capture_fps": 60,
 }
 
+# Last successfully parsed config file, reused while its mtime is unchanged
+_config_cache = {"path": None, "mtime": None, "value": None}
+
 def load_config():
     """Load configuration from file, or use defaults."""
     # Try to find config file in common Electron userData locations
@@ -54,21 +64,31 @@ def load_config():
     
     # Try each path
     for config_path in config_paths:
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    print(f"Loaded config from: {config_path}")
-                    return {
-                        "edge_width": config.get("edge_width", DEFAULT_CONFIG["edge_width"]),
-                        "red_threshold": config.get("red_threshold", DEFAULT_CONFIG["red_threshold"]),
-                        "red_ratio": config.get("red_ratio", DEFAULT_CONFIG["red_ratio"]),
-                        "cooldown": config.get("cooldown", DEFAULT_CONFIG["cooldown"]),
-                        "capture_fps": config.get("capture_fps", DEFAULT_CONFIG["capture_fps"]),
-                    }
-            except Exception as e:
-                print(f"Warning: Failed to load config from {config_path}: {e}")
-                continue
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
+            continue
+        
+        # Unchanged since the last load, skip re-reading and re-parsing it
+        if _config_cache["path"] == config_path and _config_cache["mtime"] == mtime:
+            return _config_cache["value"]
+        
+        try:
+            with open(config_path, "r") as f:
+                config = json.load(f)
+            print(f"Loaded config from: {config_path}")
+            value = {
+                "edge_width": config.get("edge_width", DEFAULT_CONFIG["edge_width"]),
+                "red_threshold": config.get("red_threshold", DEFAULT_CONFIG["red_threshold"]),
+                "red_ratio": config.get("red_ratio", DEFAULT_CONFIG["red_ratio"]),
+                "cooldown": config.get("cooldown", DEFAULT_CONFIG["cooldown"]),
+                "capture_fps": config.get("capture_fps", DEFAULT_CONFIG["capture_fps"]),
+            }
+            _config_cache.update(path=config_path, mtime=mtime, value=value)
+            return value
+        except Exception as e:
+            print(f"Warning: Failed to load config from {config_path}: {e}")
+            continue
     
     # Use defaults if no config file found
     print("No config file found, using defaults")
@@ -77,24 +97,24 @@ def load_config():
 # Load configuration (will be reloaded periodically)
 def get_config():
     """Get current config values."""
-    config = load_config()
-    return {
-        "edge_width": config["edge_width"],
-        "red_threshold": config["red_threshold"],
-        "red_ratio": config["red_ratio"],
-        "cooldown": config["cooldown"],
-        "capture_fps": config["capture_fps"],
-    }
+    return load_config()
 
 LOG_FILE = Path(os.environ.get("LOCALAPPDATA", ".")) / "EA_Battlefront2" / "haptic_events.log"
 
 # Create log directory if needed
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
+# Keep the log open for the whole session; line buffering hands each event
+# to the OS as soon as it is written so the daemon tailing it sees it at once
+_log_file = open(LOG_FILE, "a", buffering=1)
+atexit.register(_log_file.close)
+
+# mss contexts are not thread-safe, so keep one per thread and reuse it
+# across frames instead of re-creating the capture backend every grab
+_capture_state = threading.local()
+
 def find_game_window():
     """Find EA Battlefront 2 game window."""
-    import pygetwindow as gw
-    
     windows = gw.getWindowsWithTitle("STAR WARS")
     if windows:
         return windows[0]
@@ -107,66 +127,93 @@ def find_game_window():
     
     return None
 
+def get_screen_capture():
+    """Return this thread's mss instance, creating it on first use."""
+    sct = getattr(_capture_state, "sct", None)
+    if sct is None:
+        sct = _capture_state.sct = mss.mss()
+    return sct
+
 def capture_edge_regions(window, edge_width):
-    """Capture edge regions of the game window."""
-    with mss.mss() as sct:
-        # Get window bounds
-        left = window.left
-        top = window.top
-        width = window.width
-        height = window.height
-        
-        # Define edge regions
-        edges = {
-            "left": {
-                "top": top,
-                "left": left,
-                "width": edge_width,
-                "height": height
-            },
-            "right": {
-                "top": top,
-                "left": left + width - edge_width,
-                "width": edge_width,
-                "height": height
-            },
-            "top": {
-                "top": top,
-                "left": left,
-                "width": width,
-                "height": edge_width
-            },
-            "bottom": {
-                "top": top + height - edge_width,
-                "left": left,
-                "width": width,
-                "height": edge_width
-            }
+    """Capture the four edge strips of the game window as BGRA arrays."""
+    sct = get_screen_capture()
+    
+    # Get window bounds
+    left = window.left
+    top = window.top
+    width = window.width
+    height = window.height
+    
+    # Grab only the strips: their bounding box is the whole window, which
+    # would copy far more pixels per frame than the edges themselves
+    edges = {
+        "left": {
+            "top": top,
+            "left": left,
+            "width": edge_width,
+            "height": height
+        },
+        "right": {
+            "top": top,
+            "left": left + width - edge_width,
+            "width": edge_width,
+            "height": height
+        },
+        "top": {
+            "top": top,
+            "left": left,
+            "width": width,
+            "height": edge_width
+        },
+        "bottom": {
+            "top": top + height - edge_width,
+            "left": left,
+            "width": width,
+            "height": edge_width
         }
+    }
+    
+    return {edge_name: np.array(sct.grab(region)) for edge_name, region in edges.items()}
+
+def capture_loop(window, frames, stop, get_config):
+    """Capture thread - grab edge strips on a fixed schedule into a size-1 queue."""
+    next_frame = time.monotonic()
+    while not stop.is_set():
+        config = get_config()
+        frame = capture_edge_regions(window, config["edge_width"])
         
-        # Capture each edge
-        captured = {}
-        for edge_name, region in edges.items():
-            img = sct.grab(region)
-            captured[edge_name] = np.array(img)
+        # Drop the previous frame if detection hasn't taken it yet, so the
+        # detector always works on the freshest capture
+        try:
+            frames.get_nowait()
+        except queue.Empty:
+            pass
+        frames.put_nowait(frame)
         
-        return captured
+        # Sleep until the next frame is due on a fixed schedule, so capture
+        # time doesn't stretch the frame period; after an overrun, restart
+        # the schedule instead of trying to catch up
+        next_frame += 1.0 / config["capture_fps"]
+        remaining = next_frame - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            next_frame = time.monotonic()
 
 def detect_red_tint(pixels, red_threshold, red_ratio):
-    """Detect red tint in pixel array and return intensity."""
+    """Detect red tint in a BGRA pixel array (as returned by mss) and return intensity."""
     if pixels.size == 0:
         return 0
     
-    # Convert to RGB if needed (mss returns BGRA)
-    if pixels.shape[2] == 4:
-        rgb = pixels[:, :, [2, 1, 0]]  # BGR to RGB
-    else:
-        rgb = pixels
+    # Sum every channel in one integer pass straight over the BGRA buffer,
+    # no BGR->RGB copy needed
+    pixel_count = pixels.shape[0] * pixels.shape[1]
+    sum_b, sum_g, sum_r = pixels.sum(axis=(0, 1), dtype=np.int64)[:3]
     
     # Calculate average RGB values
-    avg_r = np.mean(rgb[:, :, 0])
-    avg_g = np.mean(rgb[:, :, 1])
-    avg_b = np.mean(rgb[:, :, 2])
+    avg_r = sum_r / pixel_count
+    avg_g = sum_g / pixel_count
+    avg_b = sum_b / pixel_count
     
     # Check if red is dominant
     if avg_r < red_threshold:
@@ -186,9 +233,7 @@ def write_damage_event(edge, intensity):
     """Write damage event to log file."""
     timestamp = int(time.time() * 1000)  # Milliseconds
     event_line = f"{timestamp}|DAMAGE|{edge}|{intensity}\n"
-    
-    with open(LOG_FILE, "a") as f:
-        f.write(event_line)
+    _log_file.write(event_line)
     
     print(f"[{timestamp}] DAMAGE detected: {edge} edge, intensity {intensity}")
 
@@ -217,23 +262,43 @@ def main():
     print("Monitoring for damage indicators...")
     print("(Press Ctrl+C to stop)\n")
     
+    # Capture runs on its own thread so a slow detection pass never stalls
+    # the capture cadence; the queue holds only the latest frame
+    frames = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    capture_thread = threading.Thread(
+        target=capture_loop,
+        args=(window, frames, stop, lambda: config),
+        daemon=True,
+    )
+    capture_thread.start()
+    
+    # Loop timing uses the monotonic clock so wall-clock adjustments can't
+    # cause missed frames or double-fired cooldowns
     last_detected = {}  # Track last detection time per edge
-    last_config_check = time.time()
+    last_config_check = time.monotonic()
     config_check_interval = 5.0  # Check for config updates every 5 seconds
     
     try:
         while True:
             # Periodically reload config (in case user changed settings in UI)
-            now = time.time()
+            now = time.monotonic()
             if now - last_config_check > config_check_interval:
                 config = get_config()
                 last_config_check = now
             
-            # Capture edge regions
-            edges = capture_edge_regions(window, config["edge_width"])
+            # Wait for the next captured frame (short timeout keeps Ctrl+C responsive)
+            try:
+                frame = frames.get(timeout=0.5)
+            except queue.Empty:
+                if not capture_thread.is_alive():
+                    print("ERROR: Screen capture stopped unexpectedly.")
+                    break
+                continue
+            now = time.monotonic()
             
             # Check each edge for red tint
-            for edge_name, pixels in edges.items():
+            for edge_name, pixels in frame.items():
                 intensity = detect_red_tint(pixels, config["red_threshold"], config["red_ratio"])
                 
                 if intensity > 0:
@@ -242,16 +307,14 @@ def main():
                         write_damage_event(edge_name, intensity)
                         last_detected[edge_name] = now
             
-            # Small delay to avoid excessive CPU usage
-            time.sleep(1.0 / config["capture_fps"])
-            
     except KeyboardInterrupt:
         print("\nStopped monitoring.")
+    finally:
+        stop.set()
+        capture_thread.join(timeout=1.0)
 
 if __name__ == "__main__":
-    try:
-        import pygetwindow
-    except ImportError:
+    if gw is None:
         print("ERROR: pygetwindow not installed.")
         print("Install with: pip install pygetwindow")
         exit(1)
@@ -16,10 +16,18 @@ Exit codes:
     1 - Tests failed or checks failed
 """
 
+import contextlib
+import importlib
+import io
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Counts from pytest's summary line
+PASSED_RE = re.compile(r"(\d+) passed")
+WARNINGS_RE = re.compile(r"(\d+) warnings?")
+
 
 def run_command(cmd: list[str], cwd: Path = None) -> tuple[int, str]:
     """Run a command and return (exit_code, output)."""
@@ -32,6 +40,19 @@ def run_command(cmd: list[str], cwd: Path = None) -> tuple[int, str]:
     return result.returncode, result.stdout + result.stderr
 
 
+def run_pytest(args: list[str]) -> tuple[int, str]:
+    """Run pytest in this interpreter and return (exit_code, output)."""
+    try:
+        import pytest
+    except ImportError:
+        return 1, "pytest is not installed"
+    
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        code = pytest.main(args)
+    return int(code), buffer.getvalue()
+
+
 def main():
     # Find project root
     script_dir = Path(__file__).parent
@@ -45,10 +66,16 @@ def main():
     errors = []
     warnings = []
     
-    # 1. Check if package is installed
+    # 1. Check if package is installed (in this interpreter, no child process).
+    # The package __init__ is lazy, so import the vest module explicitly.
     print("[CHECK] Checking package installation...")
-    code, output = run_command([sys.executable, "-c", "import modern_third_space"])
-    if code != 0:
+    try:
+        import modern_third_space.vest  # noqa: F401
+        installed = True
+    except ImportError:
+        installed = False
+    
+    if not installed:
         print("   [WARN] Package not installed, installing in dev mode...")
         code, output = run_command(
             [sys.executable, "-m", "pip", "install", "-e", "."],
@@ -58,16 +85,20 @@ def main():
             errors.append("Failed to install package")
             print(f"   [ERROR] Installation failed: {output}")
         else:
+            # This interpreter started before the editable install wrote its
+            # .pth file, so put the sources on sys.path for the in-process
+            # pytest run and registry checks below
+            sys.path.insert(0, str(project_root / "src"))
+            importlib.invalidate_caches()
             print("   [OK] Package installed")
     else:
         print("   [OK] Package already installed")
     
-    # 2. Run the game integration tests
+    # 2. Run the game integration tests in-process, capturing pytest's report
     print()
     print("[TEST] Running game integration tests...")
-    code, output = run_command(
-        [sys.executable, "-m", "pytest", "tests/test_game_integrations.py", "-v", "--tb=short"],
-        cwd=project_root
+    code, output = run_pytest(
+        [str(project_root / "tests" / "test_game_integrations.py"), "-v", "--tb=short"]
     )
     
     if code != 0:
@@ -76,12 +107,11 @@ def main():
         print("   [ERROR] Tests failed!")
     else:
         # Count passed tests
-        import re
-        passed_match = re.search(r"(\d+) passed", output)
+        passed_match = PASSED_RE.search(output)
         passed_count = passed_match.group(1) if passed_match else "?"
         
         # Check for warnings
-        warning_match = re.search(r"(\d+) warnings?", output)
+        warning_match = WARNINGS_RE.search(output)
         if warning_match:
             warnings.append(f"{warning_match.group(1)} test warnings (advisory)")
         
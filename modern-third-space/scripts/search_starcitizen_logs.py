@@ -9,45 +9,134 @@ Searches for:
 - Any events mentioning the player name
 """
 
+import mmap
 import re
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-# Common patterns to search for
+# Regexes for Star Citizen log lines, grouped by the results category they
+# describe (generic forms first, then ones based on the log structure)
 PATTERNS = {
+    # deaths
     "death": re.compile(r"<Actor Death>.*?CActor::Kill.*?'([^']+)'.*?killed by.*?'([^']+)'", re.IGNORECASE),
-    "damage": re.compile(r"(?:damage|hit|hurt|injured).*?'([^']+)'", re.IGNORECASE),
-    "shield": re.compile(r"(?:shield|shields).*?'([^']+)'", re.IGNORECASE),
-    "hull": re.compile(r"(?:hull|armor).*?'([^']+)'", re.IGNORECASE),
-    "health": re.compile(r"(?:health|heal|healing|recovery|medpen|medpen).*?'([^']+)'", re.IGNORECASE),
-    "ship_hit": re.compile(r"(?:ship|vehicle|vessel).*?(?:hit|damage|impact).*?'([^']+)'", re.IGNORECASE),
-    "player_mention": re.compile(r"'([^']+)'", re.IGNORECASE),
-}
-
-# More specific patterns based on Star Citizen log structure
-SPECIFIC_PATTERNS = {
     "actor_death": re.compile(r"\[Notice\].*?<Actor Death>.*?CActor::Kill.*?'([^']+)'.*?killed by.*?'([^']+)'", re.IGNORECASE),
+    # damage
+    "damage": re.compile(r"(?:damage|hit|hurt|injured).*?'([^']+)'", re.IGNORECASE),
     "damage_received": re.compile(r"(?:Damage|Hit|Injury).*?'([^']+)'.*?(?:received|took|sustained)", re.IGNORECASE),
-    "shield_damage": re.compile(r"(?:Shield|Shields).*?'([^']+)'.*?(?:damage|depleted|down|broken)", re.IGNORECASE),
+    # shield
+    "shield": re.compile(r"shields?.*?'([^']+)'", re.IGNORECASE),
+    "shield_damage": re.compile(r"shields?.*?'([^']+)'.*?(?:damage|depleted|down|broken)", re.IGNORECASE),
+    # hull
+    "hull": re.compile(r"(?:hull|armor).*?'([^']+)'", re.IGNORECASE),
     "hull_damage": re.compile(r"(?:Hull|Armor).*?'([^']+)'.*?(?:damage|breach|penetrated)", re.IGNORECASE),
+    # health
+    "health": re.compile(r"(?:health|heal|healing|recovery|medpen).*?'([^']+)'", re.IGNORECASE),
     "health_change": re.compile(r"(?:Health|HP).*?'([^']+)'.*?(?:change|update|restore|heal)", re.IGNORECASE),
+    # healing
     "healing": re.compile(r"(?:Heal|Healing|Medpen|Recovery).*?'([^']+)'", re.IGNORECASE),
+    # ship_hits
+    "ship_hit": re.compile(r"(?:ship|vehicle|vessel).*?(?:hit|damage|impact).*?'([^']+)'", re.IGNORECASE),
     "ship_impact": re.compile(r"(?:Ship|Vehicle).*?'([^']+)'.*?(?:hit|impact|collision|crash)", re.IGNORECASE),
+    # other_mentions
+    "player_mention": re.compile(r"'([^']+)'"),
 }
 
+# Default Game.log locations tried when no path is given (Windows only)
+COMMON_LOG_PATHS = (
+    Path("C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"),
+    Path("C:/Program Files (x86)/Steam/steamapps/common/StarCitizen/Game.log"),
+    Path("C:/Program Files/Steam/steamapps/common/StarCitizen/Game.log"),
+)
 
-def search_log_file(log_path: Path, player_name: str) -> Dict[str, List[str]]:
-    """Search Game.log for events related to player_name."""
+# Events printed per category; only these are kept, the rest are just counted
+DISPLAY_LIMIT = 20
+
+# Bytes of Game.log scanned per step
+SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Lowercase keywords used to categorize lines that mention the player,
+# built once instead of per line
+DAMAGE_KEYWORDS = ("damage", "hit", "hurt", "injured")
+SHIELD_KEYWORDS = ("shield",)  # also covers "shields"
+HULL_KEYWORDS = ("hull", "armor")
+HEALING_KEYWORDS = ("heal", "medpen", "recovery", "restore")  # "heal" covers "healing"
+HEALTH_KEYWORDS = ("health", "hp")
+SHIP_KEYWORDS = ("ship", "vehicle", "vessel")
+IMPACT_KEYWORDS = ("hit", "impact", "collision", "crash")
+
+
+# (keyword, category) pairs in priority order; the first keyword found in a
+# line decides its category. Shield and hull win over generic damage.
+CATEGORY_RULES = tuple(
+    (keyword, category)
+    for keywords, category in (
+        (SHIELD_KEYWORDS, "shield"),
+        (HULL_KEYWORDS, "hull"),
+        (DAMAGE_KEYWORDS, "damage"),
+        (HEALING_KEYWORDS, "healing"),
+        (HEALTH_KEYWORDS, "health"),
+        (SHIP_KEYWORDS, "ship_hits"),
+    )
+    for keyword in keywords
+)
+
+
+@dataclass(slots=True)
+class CategoryHits:
+    """Matches for one results category: a total count plus the first few lines."""
+    count: int = 0
+    shown: List[Tuple[int, str]] = field(default_factory=list)
+    
+    def add(self, line_num: int, line: str) -> None:
+        self.count += 1
+        if len(self.shown) < DISPLAY_LIMIT:
+            self.shown.append((line_num, line))
+
+
+def contains_any(text: str, keywords: tuple) -> bool:
+    """Return True if any keyword occurs in text (stops at the first hit)."""
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
+
+def categorize_line(line: str, line_lower: str) -> Optional[str]:
+    """Return the results category for a line, or None if it should be dropped."""
+    if "<Actor Death>" in line or "CActor::Kill" in line:
+        return "deaths"
+    
+    for keyword, category in CATEGORY_RULES:
+        if keyword in line_lower:
+            # Ship lines only count when they describe an impact
+            if category == "ship_hits" and not contains_any(line_lower, IMPACT_KEYWORDS):
+                return None
+            return category
+    
+    return "other_mentions"
+
+
+def search_log_file(log_path: Path, player_name: str) -> Dict[str, CategoryHits]:
+    """Search Game.log for events related to player_name.
+    
+    Each category keeps (line number, raw line) pairs for the first
+    DISPLAY_LIMIT matches only, so memory stays bounded on busy logs;
+    formatting is left to print_results.
+    """
     results = {
-        "deaths": [],
-        "damage": [],
-        "shield": [],
-        "hull": [],
-        "health": [],
-        "healing": [],
-        "ship_hits": [],
-        "other_mentions": [],
+        key: CategoryHits()
+        for key in (
+            "deaths",
+            "damage",
+            "shield",
+            "hull",
+            "health",
+            "healing",
+            "ship_hits",
+            "other_mentions",
+        )
     }
     
     if not log_path.exists():
@@ -57,45 +146,65 @@ def search_log_file(log_path: Path, player_name: str) -> Dict[str, List[str]]:
     print(f"Searching {log_path} for events related to '{player_name}'...")
     print(f"File size: {log_path.stat().st_size / 1024 / 1024:.2f} MB\n")
     
-    player_lower = player_name.lower()
+    # Mentions are found on ASCII-lowercased bytes (Star Citizen handles are
+    # ASCII), so only the lines that mention the player are ever decoded
+    player_bytes = player_name.encode("utf-8").lower()
     line_count = 0
     matches = 0
     
     try:
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                line_count += 1
-                line_lower = line.lower()
-                
-                # Check if line mentions player name
-                if player_lower not in line_lower:
-                    continue
+        if log_path.stat().st_size == 0:
+            print(f"Processed 0 lines, found 0 mentions of '{player_name}'\n")
+            return results
+        
+        with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The scan reads strictly front to back; let the kernel read ahead
+            # aggressively (not available on Windows)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            
+            size = len(mm)
+            chunk_start = 0
+            line_num = 1  # Number of the line starting at the scan position
+            
+            while chunk_start < size:
+                # Scan in large windows, each extended to the end of the line it
+                # stops in so no line straddles two windows
+                chunk_end = mm.find(b"\n", min(chunk_start + SCAN_CHUNK_SIZE, size) - 1)
+                chunk_end = size if chunk_end == -1 else chunk_end + 1
+                chunk = mm[chunk_start:chunk_end]
+                chunk_lower = chunk.lower()
+                chunk_start = chunk_end
                 
-                matches += 1
+                pos = 0  # Start of the first line in chunk not scanned yet
+                while True:
+                    hit = chunk_lower.find(player_bytes, pos)
+                    if hit == -1:
+                        break
+                    
+                    # Expand the hit to its full line and count the newlines skipped
+                    start = max(pos, chunk_lower.rfind(b"\n", pos, hit) + 1)
+                    end = chunk_lower.find(b"\n", hit + len(player_bytes))
+                    if end == -1:
+                        end = len(chunk)
+                    line_num += chunk_lower.count(b"\n", pos, start)
+                    
+                    line = chunk[start:end].decode('utf-8', errors='ignore')
+                    matches += 1
+                    
+                    category = categorize_line(line, line.lower())
+                    if category:
+                        results[category].add(line_num, line)
+                    
+                    pos = end + 1
+                    line_num += 1
                 
-                # Categorize the event
-                if "<Actor Death>" in line or "CActor::Kill" in line:
-                    results["deaths"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["damage", "hit", "hurt", "injured"]):
-                    if "shield" in line_lower:
-                        results["shield"].append(f"Line {line_num}: {line.strip()[:200]}")
-                    elif "hull" in line_lower or "armor" in line_lower:
-                        results["hull"].append(f"Line {line_num}: {line.strip()[:200]}")
-                    else:
-                        results["damage"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["shield", "shields"]):
-                    results["shield"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["hull", "armor"]):
-                    results["hull"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["heal", "healing", "medpen", "recovery", "restore"]):
-                    results["healing"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["health", "hp"]):
-                    results["health"].append(f"Line {line_num}: {line.strip()[:200]}")
-                elif any(keyword in line_lower for keyword in ["ship", "vehicle", "vessel"]):
-                    if any(keyword in line_lower for keyword in ["hit", "impact", "collision", "crash"]):
-                        results["ship_hits"].append(f"Line {line_num}: {line.strip()[:200]}")
-                else:
-                    results["other_mentions"].append(f"Line {line_num}: {line.strip()[:200]}")
+                line_num += chunk_lower.count(b"\n", pos)
+            
+            # An unterminated last line without a mention was not counted yet
+            line_count = line_num - 1
+            if mm[-1:] != b"\n" and pos <= len(chunk):
+                line_count += 1
     
     except Exception as e:
         print(f"Error reading log file: {e}")
@@ -105,7 +214,7 @@ def search_log_file(log_path: Path, player_name: str) -> Dict[str, List[str]]:
     return results
 
 
-def print_results(results: Dict[str, List[str]], player_name: str):
+def print_results(results: Dict[str, CategoryHits], player_name: str):
     """Print search results in a formatted way."""
     print("=" * 80)
     print(f"EVENTS RELATED TO '{player_name}'")
@@ -124,14 +233,17 @@ def print_results(results: Dict[str, List[str]], player_name: str):
     ]
     
     for key, title in categories:
-        events = results[key]
-        if events:
-            print(f"\n{title} ({len(events)} found):")
-            print("-" * 80)
-            for event in events[:20]:  # Show first 20 of each type
-                print(event)
-            if len(events) > 20:
-                print(f"... and {len(events) - 20} more")
+        hits = results[key]
+        if hits.count:
+            # Build the whole section and write it in one call
+            lines = [f"\n{title} ({hits.count} found):", "-" * 80]
+            lines.extend(
+                f"Line {line_num}: {line.strip()[:200]}"
+                for line_num, line in hits.shown
+            )
+            if hits.count > len(hits.shown):
+                lines.append(f"... and {hits.count - len(hits.shown)} more")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"\n{title}: None found")
     
@@ -152,18 +264,13 @@ def main():
     if len(sys.argv) >= 3:
         log_path = Path(sys.argv[2])
     else:
-        # Try common locations
-        common_paths = [
-            Path("C:/Program Files/Roberts Space Industries/StarCitizen/LIVE/Game.log"),
-            Path("C:/Program Files (x86)/Steam/steamapps/common/StarCitizen/Game.log"),
-            Path("C:/Program Files/Steam/steamapps/common/StarCitizen/Game.log"),
-        ]
-        
+        # Try common locations (Star Citizen only installs on Windows)
         log_path = None
-        for path in common_paths:
-            if path.exists():
-                log_path = path
-                break
+        if sys.platform == "win32":
+            for path in COMMON_LOG_PATHS:
+                if path.exists():
+                    log_path = path
+                    break
         
         if not log_path:
             print("Error: Could not find Game.log file.")
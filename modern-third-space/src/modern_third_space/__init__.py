@@ -24,7 +24,15 @@ Usage:
         controller.trigger_effect(cell=0, speed=5)
 """
 
-# Re-export from vest core for backwards compatibility and convenience
-from .vest import VestController, VestStatus, list_devices
-
+# Re-export from vest core for backwards compatibility and convenience.
+# Resolved on first access so importing a submodule (e.g. the CLI) doesn't
+# load the USB backend up front.
 __all__ = ["VestController", "VestStatus", "list_devices"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import vest
+        
+        return getattr(vest, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
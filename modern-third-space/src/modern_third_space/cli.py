@@ -30,15 +30,20 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import sys
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-# Import from vest core package
-from .vest import VestController, list_devices
+# The vest core (USB backend) and UI presets are imported inside the commands
+# that use them, so ping/help/daemon/cs2 don't pay for loading them
+if TYPE_CHECKING:
+    from .vest import VestController
 
-# Import UI presets (separate from vest core)
-from .presets import default_effects
+# Fixed-shape replies, encoded once instead of on every call
+PING_RESPONSE = json.dumps({"status": "ok", "message": "Python bridge is reachable"}) + "\n"
+STOP_RESPONSE = json.dumps({"success": True, "action": "stop_all"}) + "\n"
 
 
 def _cmd_status(controller: VestController) -> int:
@@ -60,27 +65,38 @@ def _cmd_trigger(controller: VestController, args: argparse.Namespace) -> int:
 def _cmd_stop(controller: VestController) -> int:
     """Stop all actuators."""
     controller.stop_all()
-    print(json.dumps({"success": True, "action": "stop_all"}))
+    sys.stdout.write(STOP_RESPONSE)
     return 0
 
 
-def _cmd_effects(_controller: VestController) -> int:
+def _dump_json(data: Any, pretty: bool) -> str:
+    """Encode machine-read output compactly, or indented with --pretty."""
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _cmd_effects(args: argparse.Namespace) -> int:
     """List default effect presets (UI data)."""
+    from .presets import default_effects
+    
     effects = default_effects()
-    print(json.dumps(effects, indent=2))
+    print(_dump_json(effects, args.pretty))
     return 0
 
 
 def _cmd_ping() -> int:
     """Health check - verify CLI is reachable."""
-    print(json.dumps({"status": "ok", "message": "Python bridge is reachable"}))
+    sys.stdout.write(PING_RESPONSE)
     return 0
 
 
-def _cmd_list() -> int:
+def _cmd_list(args: argparse.Namespace) -> int:
     """List all connected USB vest devices."""
+    from .vest import list_devices
+    
     devices = list_devices()
-    print(json.dumps(devices, indent=2))
+    print(_dump_json(devices, args.pretty))
     return 0
 
 
@@ -102,13 +118,114 @@ def _cmd_connect(controller: VestController, args: argparse.Namespace) -> int:
     return 0 if status.connected else 1
 
 
+# -------------------------------------------------------------------------
+# Forwarding to a running daemon
+# -------------------------------------------------------------------------
+
+# Overall time a connected daemon gets to answer a forwarded command
+DAEMON_REPLY_TIMEOUT = 2.0
+
+
+def _send_to_daemon(payload: Dict[str, Any], host: str, port: int) -> Dict[str, Any] | None:
+    """
+    Send one command to a running daemon and return its response.
+    
+    Returns None if nothing accepts the connection, so the caller can fall
+    back to opening the vest itself. A peer that accepts but doesn't answer
+    within DAEMON_REPLY_TIMEOUT gets an error response instead.
+    """
+    import socket
+    import time
+    
+    payload = {**payload, "req_id": "cli"}
+    try:
+        sock = socket.create_connection((host, port), timeout=0.5)
+    except OSError:
+        return None
+    
+    deadline = time.monotonic() + DAEMON_REPLY_TIMEOUT
+    try:
+        with sock, sock.makefile("rb") as stream:
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            
+            # New clients are sent events first; skip to our response
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout
+                sock.settimeout(remaining)
+                line = stream.readline()
+                if not line:
+                    break
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(data, dict) and data.get("req_id") == "cli" and "response" in data:
+                    return data
+    except socket.timeout:
+        return {
+            "response": "error",
+            "message": f"Daemon at {host}:{port} did not respond within {DAEMON_REPLY_TIMEOUT:g}s",
+        }
+    except OSError as e:
+        return {"response": "error", "message": f"Daemon at {host}:{port} failed: {e}"}
+    
+    return {"response": "error", "message": f"Daemon at {host}:{port} closed the connection"}
+
+
+def _daemon_ports(args: argparse.Namespace) -> list[int]:
+    """
+    Ports to look for a daemon on: --daemon-port if given, else the default
+    port and then any other port a running daemon wrote a PID file for.
+    """
+    if args.daemon_port is not None:
+        return [args.daemon_port]
+    
+    from .server.lifecycle import DEFAULT_PORT, find_running_daemon_ports
+    
+    return [DEFAULT_PORT] + [p for p in find_running_daemon_ports() if p != DEFAULT_PORT]
+
+
+def _forward_vest_command(command: str, args: argparse.Namespace) -> int | None:
+    """
+    Run trigger/stop through a running daemon, which owns the vest while it runs.
+    
+    Prints the same JSON as the local commands. Returns None if the command
+    isn't forwarded or no daemon is running.
+    """
+    if command == "trigger":
+        payload = {"cmd": "trigger", "cell": args.cell, "speed": args.speed}
+    elif command == "stop":
+        payload = {"cmd": "stop"}
+    else:
+        return None
+    
+    for port in _daemon_ports(args):
+        response = _send_to_daemon(payload, args.daemon_host, port)
+        if response is not None:
+            break
+    else:
+        return None
+    
+    if response.get("response") == "error":
+        print(json.dumps({"success": False, "error": response.get("message")}))
+        return 1
+    
+    if command == "trigger":
+        print(json.dumps({"success": True, "cell": args.cell, "speed": args.speed}))
+    else:
+        sys.stdout.write(STOP_RESPONSE)
+    return 0
+
+
 # -------------------------------------------------------------------------
 # Daemon subcommands
 # -------------------------------------------------------------------------
 
 def _cmd_daemon(args: argparse.Namespace) -> int:
     """Handle daemon subcommands."""
-    action = getattr(args, "daemon_action", None) or "start"
+    action = args.daemon_action
     
     if action == "start":
         return _daemon_start(args)
@@ -135,11 +252,11 @@ def _daemon_start(args: argparse.Namespace) -> int:
 
 def _daemon_stop(args: argparse.Namespace) -> int:
     """Stop the vest daemon server."""
-    from .server import stop_daemon
+    from .server.lifecycle import stop_daemon
     
     host = args.host
     port = args.port
-    force = getattr(args, "force", False)
+    force = args.force
     
     success, message = stop_daemon(host=host, port=port, force=force)
     
@@ -153,38 +270,56 @@ def _daemon_stop(args: argparse.Namespace) -> int:
 
 def _daemon_status(args: argparse.Namespace) -> int:
     """Check daemon status."""
-    from .server import get_daemon_status, ping_daemon, get_pid_file_path
+    from .server.lifecycle import get_daemon_status, ping_daemon, get_pid_file_path
     
     host = args.host
     port = args.port
     
     is_running, pid, message = get_daemon_status(host, port)
     
-    print(f"Daemon: {'[RUNNING]' if is_running else '[NOT RUNNING]'}")
-    print(f"Status: {message}")
-    print(f"PID file: {get_pid_file_path(port)}")
-    
-    if is_running:
-        # Try to ping for more details
-        success, response = ping_daemon(host, port)
-        if success:
-            print(f"Connected to vest: {'Yes' if response.get('connected') else 'No'}")
-            print(f"Device selected: {'Yes' if response.get('has_device_selected') else 'No'}")
-            print(f"Connected clients: {response.get('client_count', 0)}")
-        else:
-            print(f"Ping failed: {response.get('error', 'Unknown error')}")
-        return 0
+    # Each section is written in one call; the process section goes out
+    # before the ping so a slow daemon doesn't leave the terminal blank
+    sys.stdout.write(
+        f"Daemon: {'[RUNNING]' if is_running else '[NOT RUNNING]'}\n"
+        f"Status: {message}\n"
+        f"PID file: {get_pid_file_path(port)}\n"
+    )
     
-    return 1
+    if not is_running:
+        return 1
+    
+    sys.stdout.flush()
+    
+    # Try to ping for more details
+    success, response = ping_daemon(host, port)
+    if success:
+        sys.stdout.write(
+            f"Connected to vest: {'Yes' if response.get('connected') else 'No'}\n"
+            f"Device selected: {'Yes' if response.get('has_device_selected') else 'No'}\n"
+            f"Connected clients: {response.get('client_count', 0)}\n"
+        )
+    else:
+        print(f"Ping failed: {response.get('error', 'Unknown error')}")
+    return 0
 
 
 # -------------------------------------------------------------------------
 # CS2 GSI subcommands
 # -------------------------------------------------------------------------
 
+CS2_START_BANNER = """\
+[CS2] Starting CS2 GSI integration...
+   GSI server: http://{gsi_host}:{gsi_port}
+   Daemon: {daemon}
+
+[INFO] Make sure CS2 has the GSI config file:
+   Run: python -m modern_third_space.cli cs2 generate-config
+
+"""
+
 def _cmd_cs2(args: argparse.Namespace) -> int:
     """Handle CS2 GSI subcommands."""
-    action = getattr(args, "cs2_action", None) or "start"
+    action = args.cs2_action
     
     if action == "start":
         return _cs2_start(args)
@@ -199,24 +334,18 @@ def _cmd_cs2(args: argparse.Namespace) -> int:
 
 def _cs2_start(args: argparse.Namespace) -> int:
     """Start the CS2 GSI integration."""
-    import asyncio
-    from .integrations.cs2_gsi import run_cs2_gsi
+    gsi_host = args.gsi_host
+    gsi_port = args.gsi_port
+    daemon_host = args.daemon_host
+    daemon_port = args.daemon_port
     
-    gsi_host = getattr(args, "gsi_host", "127.0.0.1")
-    gsi_port = getattr(args, "gsi_port", 3000)
-    daemon_host = getattr(args, "daemon_host", "127.0.0.1")
-    daemon_port = getattr(args, "daemon_port", None)
+    daemon = f"{daemon_host}:{daemon_port}" if daemon_port else f"auto-discover on {daemon_host}"
+    sys.stdout.write(CS2_START_BANNER.format(gsi_host=gsi_host, gsi_port=gsi_port, daemon=daemon))
+    sys.stdout.flush()
     
-    print(f"[CS2] Starting CS2 GSI integration...")
-    print(f"   GSI server: http://{gsi_host}:{gsi_port}")
-    if daemon_port:
-        print(f"   Daemon: {daemon_host}:{daemon_port}")
-    else:
-        print(f"   Daemon: auto-discover on {daemon_host}")
-    print()
-    print("[INFO] Make sure CS2 has the GSI config file:")
-    print("   Run: python -m modern_third_space.cli cs2 generate-config")
-    print()
+    # Show the banner before paying for the asyncio/GSI imports
+    import asyncio
+    from .integrations.cs2_gsi import run_cs2_gsi
     
     try:
         asyncio.run(run_cs2_gsi(
@@ -233,12 +362,11 @@ def _cs2_start(args: argparse.Namespace) -> int:
 
 def _cs2_generate_config(args: argparse.Namespace) -> int:
     """Generate CS2 GSI config file."""
-    import os
     from .integrations.cs2_gsi import generate_gsi_config, get_cs2_cfg_path
     
-    gsi_host = getattr(args, "gsi_host", "127.0.0.1")
-    gsi_port = getattr(args, "gsi_port", 3000)
-    output_path = getattr(args, "output", None)
+    gsi_host = args.gsi_host
+    gsi_port = args.gsi_port
+    output_path = args.output
     
     config_content = generate_gsi_config(host=gsi_host, port=gsi_port)
     
@@ -256,17 +384,19 @@ def _cs2_generate_config(args: argparse.Namespace) -> int:
         config_file = os.path.join(cs2_cfg_path, "gamestate_integration_thirdspace.cfg")
         
         # Ask for confirmation
-        print(f"📂 Found CS2 config directory:")
-        print(f"   {cs2_cfg_path}")
-        print()
-        print(f"📄 Will create:")
-        print(f"   {config_file}")
-        print()
-        print("Config content:")
-        print("-" * 40)
-        print(config_content)
-        print("-" * 40)
-        print()
+        sys.stdout.write("\n".join([
+            "📂 Found CS2 config directory:",
+            f"   {cs2_cfg_path}",
+            "",
+            "📄 Will create:",
+            f"   {config_file}",
+            "",
+            "Config content:",
+            "-" * 40,
+            config_content,
+            "-" * 40,
+            "",
+        ]) + "\n")
         
         response = input("Write this file? [y/N] ").strip().lower()
         if response == "y":
@@ -281,15 +411,17 @@ def _cs2_generate_config(args: argparse.Namespace) -> int:
             return 1
     else:
         # Print config and manual instructions
-        print("[INFO] Could not find CS2 config directory automatically.")
-        print()
-        print("[INFO] Manually create this file:")
-        print("   <CS2_DIR>/game/csgo/cfg/gamestate_integration_thirdspace.cfg")
-        print()
-        print("Config content:")
-        print("-" * 40)
-        print(config_content)
-        print("-" * 40)
+        sys.stdout.write("\n".join([
+            "[INFO] Could not find CS2 config directory automatically.",
+            "",
+            "[INFO] Manually create this file:",
+            "   <CS2_DIR>/game/csgo/cfg/gamestate_integration_thirdspace.cfg",
+            "",
+            "Config content:",
+            "-" * 40,
+            config_content,
+            "-" * 40,
+        ]) + "\n")
         return 0
 
 
@@ -298,114 +430,131 @@ def _cs2_status(args: argparse.Namespace) -> int:
     import socket
     from .integrations.cs2_gsi import find_daemon_port, get_cs2_cfg_path
     
-    gsi_port = getattr(args, "gsi_port", 3000)
-    daemon_host = getattr(args, "daemon_host", "127.0.0.1")
+    gsi_port = args.gsi_port
+    daemon_host = args.daemon_host
     
-    print("[CS2] CS2 GSI Integration Status")
-    print("=" * 40)
+    # Collect the report and write it in one call once all checks are done
+    lines = ["[CS2] CS2 GSI Integration Status", "=" * 40]
     
-    # Check if GSI port is in use (integration running)
+    # Check if GSI port is in use (integration running). A closed port on
+    # localhost is refused immediately, so the timeout only bounds a hung peer.
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(0.5)
-        result = sock.connect_ex(("127.0.0.1", gsi_port))
-        sock.close()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            result = sock.connect_ex(("127.0.0.1", gsi_port))
         
         if result == 0:
-            print(f"GSI Server: [RUNNING] on port {gsi_port}")
+            lines.append(f"GSI Server: [RUNNING] on port {gsi_port}")
         else:
-            print(f"GSI Server: [NOT RUNNING]")
+            lines.append("GSI Server: [NOT RUNNING]")
     except Exception:
-        print(f"GSI Server: [NOT RUNNING]")
+        lines.append("GSI Server: [NOT RUNNING]")
     
     # Check daemon
     daemon_port = find_daemon_port(daemon_host)
     if daemon_port:
-        print(f"Vest Daemon: [RUNNING] on port {daemon_port}")
+        lines.append(f"Vest Daemon: [RUNNING] on port {daemon_port}")
     else:
-        print(f"Vest Daemon: [NOT RUNNING]")
+        lines.append("Vest Daemon: [NOT RUNNING]")
     
     # Check CS2 config file
     cs2_cfg_path = get_cs2_cfg_path()
     if cs2_cfg_path:
-        import os
         config_file = os.path.join(cs2_cfg_path, "gamestate_integration_thirdspace.cfg")
         if os.path.exists(config_file):
-            print(f"GSI Config: [OK] Found at {config_file}")
+            lines.append(f"GSI Config: [OK] Found at {config_file}")
         else:
-            print(f"GSI Config: [MISSING] Not found (run: cs2 generate-config)")
+            lines.append("GSI Config: [MISSING] Not found (run: cs2 generate-config)")
     else:
-        print(f"GSI Config: [WARN] CS2 directory not found")
+        lines.append("GSI Config: [WARN] CS2 directory not found")
     
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
     return 0
 
 
-COMMANDS: Dict[str, Any] = {
-    "status": _cmd_status,
-    "trigger": _cmd_trigger,
-    "stop": _cmd_stop,
-    "effects": _cmd_effects,
-    "ping": _cmd_ping,
-    "list": _cmd_list,
-    "connect": _cmd_connect,
-    "daemon": _cmd_daemon,
-    "cs2": _cmd_cs2,
-}
-
-
-def build_parser() -> argparse.ArgumentParser:
-    """Build the argument parser."""
-    parser = argparse.ArgumentParser(
-        description="Modern Third Space Vest bridge CLI"
+def _add_daemon_target_args(parser: argparse.ArgumentParser) -> None:
+    """Options for the commands that go through a running daemon."""
+    from .server.lifecycle import DEFAULT_HOST, DEFAULT_PORT
+    
+    parser.add_argument(
+        "--daemon-host", type=str, default=DEFAULT_HOST,
+        help=f"Daemon host to forward to when one is running (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--daemon-port", type=int, default=None,
+        help=f"Daemon port (default: {DEFAULT_PORT}, then any daemon with a PID file)",
     )
-    sub = parser.add_subparsers(dest="command", required=True)
 
-    sub.add_parser("status", help="Print connection status")
-    sub.add_parser("effects", help="List default effect presets")
 
+def _add_trigger_parser(sub: argparse._SubParsersAction) -> None:
     trigger = sub.add_parser("trigger", help="Trigger a single actuator")
     trigger.add_argument("--cell", type=int, required=True, help="Cell index (0-7)")
     trigger.add_argument("--speed", type=int, required=True, help="Speed (0-10)")
+    _add_daemon_target_args(trigger)
 
-    sub.add_parser("stop", help="Stop all actuators")
-    sub.add_parser("ping", help="Health check - verify CLI is reachable")
-    sub.add_parser("list", help="List all connected USB vest devices")
-    
+
+def _add_stop_parser(sub: argparse._SubParsersAction) -> None:
+    stop = sub.add_parser("stop", help="Stop all actuators")
+    _add_daemon_target_args(stop)
+
+
+def _add_list_parser(sub: argparse._SubParsersAction) -> None:
+    list_parser = sub.add_parser("list", help="List all connected USB vest devices")
+    list_parser.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+
+
+def _add_effects_parser(sub: argparse._SubParsersAction) -> None:
+    effects = sub.add_parser("effects", help="List default effect presets")
+    effects.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+
+
+def _add_connect_parser(sub: argparse._SubParsersAction) -> None:
     connect = sub.add_parser("connect", help="Connect to a specific device")
     connect.add_argument("--bus", type=int, help="USB bus number (requires --address)")
     connect.add_argument("--address", type=int, help="USB device address (requires --bus)")
     connect.add_argument("--serial", type=str, help="Device serial number")
     connect.add_argument("--index", type=int, help="Device index in list")
-    
+
+
+def _add_daemon_parser(sub: argparse._SubParsersAction) -> None:
     # Daemon command with subcommands
     daemon = sub.add_parser("daemon", help="Manage the vest daemon server")
     daemon.add_argument("--host", type=str, default="127.0.0.1", help="Host (default: 127.0.0.1)")
     daemon.add_argument("--port", type=int, default=5050, help="Port (default: 5050)")
     
     daemon_sub = daemon.add_subparsers(dest="daemon_action")
+    # Bare `daemon` means `daemon start`
+    daemon.set_defaults(daemon_action="start", force=False)
     
     # daemon start
     daemon_start = daemon_sub.add_parser("start", help="Start the daemon")
     daemon_start.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind to")
     daemon_start.add_argument("--port", type=int, default=5050, help="Port to listen on")
     
+    # Options shared by the subcommands that talk to a running daemon
+    daemon_target = argparse.ArgumentParser(add_help=False)
+    daemon_target.add_argument("--host", type=str, default="127.0.0.1", help="Daemon host")
+    daemon_target.add_argument("--port", type=int, default=5050, help="Daemon port")
+    
     # daemon stop
-    daemon_stop = daemon_sub.add_parser("stop", help="Stop the daemon")
-    daemon_stop.add_argument("--host", type=str, default="127.0.0.1", help="Daemon host")
-    daemon_stop.add_argument("--port", type=int, default=5050, help="Daemon port")
+    daemon_stop = daemon_sub.add_parser("stop", parents=[daemon_target], help="Stop the daemon")
     daemon_stop.add_argument("--force", action="store_true", help="Force kill (SIGKILL)")
     
     # daemon status
-    daemon_status = daemon_sub.add_parser("status", help="Check daemon status")
-    daemon_status.add_argument("--host", type=str, default="127.0.0.1", help="Daemon host")
-    daemon_status.add_argument("--port", type=int, default=5050, help="Daemon port")
-    
-    # -------------------------------------------------------------------------
-    # CS2 GSI commands
-    # -------------------------------------------------------------------------
+    daemon_sub.add_parser("status", parents=[daemon_target], help="Check daemon status")
+
+
+def _add_cs2_parser(sub: argparse._SubParsersAction) -> None:
     cs2 = sub.add_parser("cs2", help="Counter-Strike 2 GSI integration")
     cs2_sub = cs2.add_subparsers(dest="cs2_action")
+    # Bare `cs2` means `cs2 start` with its default options
+    cs2.set_defaults(
+        cs2_action="start",
+        gsi_host="127.0.0.1",
+        gsi_port=3000,
+        daemon_host="127.0.0.1",
+        daemon_port=None,
+    )
     
     # cs2 start
     cs2_start = cs2_sub.add_parser("start", help="Start CS2 GSI integration")
@@ -424,39 +573,107 @@ def build_parser() -> argparse.ArgumentParser:
     cs2_status = cs2_sub.add_parser("status", help="Check CS2 GSI status")
     cs2_status.add_argument("--gsi-port", type=int, default=3000, help="GSI server port")
     cs2_status.add_argument("--daemon-host", type=str, default="127.0.0.1", help="Vest daemon host")
+
+
+# Subcommands that take no options
+OPTIONLESS_COMMANDS = frozenset({"status", "ping"})
+
+# Subcommand name -> function adding its parser, in help order
+SUBCOMMANDS = {
+    "status": lambda sub: sub.add_parser("status", help="Print connection status"),
+    "effects": _add_effects_parser,
+    "trigger": _add_trigger_parser,
+    "stop": _add_stop_parser,
+    "ping": lambda sub: sub.add_parser("ping", help="Health check - verify CLI is reachable"),
+    "list": _add_list_parser,
+    "connect": _add_connect_parser,
+    "daemon": _add_daemon_parser,
+    "cs2": _add_cs2_parser,
+}
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+    
+    When command names a subcommand, only that subcommand's parser is built,
+    since no other one can match; otherwise (e.g. top-level --help) all are.
+    Parsers are cached per command and reused by later main() calls.
+    """
+    # Anything that isn't a subcommand shares the full parser's cache entry
+    return _build_parser(command if command in SUBCOMMANDS else None)
+
+
+@functools.cache
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Modern Third Space Vest bridge CLI"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    if command is not None:
+        SUBCOMMANDS[command](sub)
+    else:
+        for add_parser in SUBCOMMANDS.values():
+            add_parser(sub)
     
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    command = args.command
-    handler = COMMANDS.get(command)
+    if argv is None:
+        argv = sys.argv[1:]
     
-    if handler is None:
-        parser.print_help()
-        return 1
+    # A bare option-less command (e.g. the frequent `ping` health check) has
+    # nothing to parse, so skip building the argument parser for it
+    if len(argv) == 1 and argv[0] in OPTIONLESS_COMMANDS:
+        args = argparse.Namespace(command=argv[0])
+    else:
+        cmd = argv[0] if argv and argv[0] in SUBCOMMANDS else None
+        parser = build_parser(cmd)
+        args, extras = parser.parse_known_args(argv)
+        if extras:
+            # Let the full parser report it, so its usage line lists every command
+            parser = build_parser(None)
+            args = parser.parse_args(argv)
+    command = args.command
     
     # Commands that don't need a controller
-    if command == "ping":
-        return handler()
-    if command == "list":
-        return handler()
-    if command == "daemon":
-        return handler(args)
-    if command == "cs2":
-        return handler(args)
+    match command:
+        case "ping":
+            return _cmd_ping()
+        case "list":
+            return _cmd_list(args)
+        case "effects":
+            return _cmd_effects(args)
+        case "daemon":
+            return _cmd_daemon(args)
+        case "cs2":
+            return _cmd_cs2(args)
+    
+    # A running daemon holds the vest, so go through it when it's up
+    forwarded = _forward_vest_command(command, args)
+    if forwarded is not None:
+        return forwarded
     
     # Commands that need a controller
+    from .vest import VestController
+    
     controller = VestController()
     
-    # Commands that need args
-    if command in ("trigger", "connect"):
-        return handler(controller, args)
-    else:
-        return handler(controller)
+    match command:
+        case "status":
+            return _cmd_status(controller)
+        case "trigger":
+            return _cmd_trigger(controller, args)
+        case "stop":
+            return _cmd_stop(controller)
+        case "connect":
+            return _cmd_connect(controller, args)
+    
+    build_parser(None).print_help()
+    return 1
 
 
 if __name__ == "__main__":
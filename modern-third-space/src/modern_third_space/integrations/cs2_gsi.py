@@ -628,17 +628,15 @@ def get_cs2_cfg_path() -> Optional[str]:
     - Linux: ~/.steam/steam/steamapps/common/Counter-Strike Global Offensive/game/csgo/cfg
     """
     import os
-    import platform
-    
-    system = platform.system()
+    import sys
     
     # CS2 still uses the legacy "Counter-Strike Global Offensive" folder name
-    if system == "Windows":
+    if sys.platform == "win32":
         paths = [
             r"C:\Program Files (x86)\Steam\steamapps\common\Counter-Strike Global Offensive\game\csgo\cfg",
             r"C:\Program Files\Steam\steamapps\common\Counter-Strike Global Offensive\game\csgo\cfg",
         ]
-    elif system == "Darwin":  # macOS
+    elif sys.platform == "darwin":  # macOS
         home = os.path.expanduser("~")
         paths = [
             f"{home}/Library/Application Support/Steam/steamapps/common/Counter-Strike Global Offensive/game/csgo/cfg",
@@ -672,10 +670,9 @@ def find_daemon_port(
     """
     for port in ports:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex((host, port))
-            sock.close()
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.5)
+                result = sock.connect_ex((host, port))
             
             if result == 0:
                 logger.info(f"Found daemon on port {port}")
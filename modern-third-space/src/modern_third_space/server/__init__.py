@@ -18,24 +18,31 @@ Or via CLI:
     python -m modern_third_space.cli daemon --port 5050
 """
 
-from .daemon import VestDaemon, run_daemon
-from .client_manager import Client, ClientManager
-from .protocol import (
-    Command,
-    CommandType,
-    Event,
-    EventType,
-    Response,
-)
-from .lifecycle import (
-    get_daemon_status,
-    stop_daemon,
-    ping_daemon,
-    is_port_in_use,
-    get_pid_file_path,
-)
-from .cs2_manager import CS2Manager, generate_cs2_config
-from .alyx_manager import AlyxManager, get_mod_info as get_alyx_mod_info
+import importlib
+
+# Re-exports are resolved on first access, so importing a light submodule
+# (e.g. lifecycle for `daemon status`/`daemon stop`) doesn't load the daemon
+# and the vest core behind it. Maps name -> (submodule, attribute).
+_EXPORTS = {
+    "VestDaemon": ("daemon", "VestDaemon"),
+    "run_daemon": ("daemon", "run_daemon"),
+    "Client": ("client_manager", "Client"),
+    "ClientManager": ("client_manager", "ClientManager"),
+    "Command": ("protocol", "Command"),
+    "CommandType": ("protocol", "CommandType"),
+    "Event": ("protocol", "Event"),
+    "EventType": ("protocol", "EventType"),
+    "Response": ("protocol", "Response"),
+    "get_daemon_status": ("lifecycle", "get_daemon_status"),
+    "stop_daemon": ("lifecycle", "stop_daemon"),
+    "ping_daemon": ("lifecycle", "ping_daemon"),
+    "is_port_in_use": ("lifecycle", "is_port_in_use"),
+    "get_pid_file_path": ("lifecycle", "get_pid_file_path"),
+    "CS2Manager": ("cs2_manager", "CS2Manager"),
+    "generate_cs2_config": ("cs2_manager", "generate_cs2_config"),
+    "AlyxManager": ("alyx_manager", "AlyxManager"),
+    "get_alyx_mod_info": ("alyx_manager", "get_mod_info"),
+}
 
 __all__ = [
     "VestDaemon",
@@ -61,3 +68,10 @@ __all__ = [
     "get_alyx_mod_info",
 ]
 
+
+def __getattr__(name):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(f".{module_name}", __name__), attr)
@@ -26,6 +26,7 @@ from pathlib import Path
 from threading import Thread
 from typing import Callable, Optional, List
 
+from .log_tailer import LogTailer
 from ..vest.cell_layout import (
     Cell,
     FRONT_CELLS,
@@ -43,7 +44,7 @@ logger = logging.getLogger(__name__)
 # Event Parser (Phase 2)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AlyxEvent:
     """Parsed event from Alyx console log."""
     type: str
@@ -58,6 +59,62 @@ class AlyxEvent:
 
 # Event format: [Tactsuit] {EventType|param1|param2|...}
 TACTSUIT_PATTERN = re.compile(r'\[Tactsuit\]\s*\{([^}]+)\}')
+TACTSUIT_MARKER = b"[Tactsuit]"
+
+# Event groups sharing a parameter layout, built once at import
+# {Event|is_primary_hand}
+HAND_EVENTS = frozenset({
+    "PlayerGrabbityPull", "PlayerGrabbityLockStart", "PlayerGrabbityLockStop",
+    "GrabbityGloveCatch",
+})
+# {Event|left_side}
+SIDE_EVENTS = frozenset({
+    "PlayerDropAmmoInBackpack", "PlayerDropResinInBackpack",
+    "PlayerRetrievedBackpackClip", "PlayerStoredItemInItemholder",
+    "PlayerRemovedItemFromItemholder", "PlayerUsingHealthstation",
+})
+
+
+def _parse_player_hurt(parts: List[str]) -> dict:
+    return {
+        "health": int(parts[1]) if parts[1].isdigit() else 100,
+        "enemy_class": parts[2],
+        "angle": float(parts[3]) if parts[3].replace('.', '').isdigit() else 0.0,
+        "enemy_name": parts[4],
+        "enemy_debug_name": parts[5],
+    }
+
+
+def _parse_player_heal(parts: List[str]) -> dict:
+    return {"angle": float(parts[1]) if parts[1].replace('.', '').replace('-', '').isdigit() else 0.0}
+
+
+def _parse_hand(parts: List[str]) -> dict:
+    return {"is_primary_hand": parts[1].lower() == "true"}
+
+
+def _parse_side(parts: List[str]) -> dict:
+    return {"left_side": parts[1] == "1"}
+
+
+# Event type -> (minimum part count, params parser). Events without
+# parameters (e.g. Reset, PlayerCoughStart), unknown events and events with
+# too few parts all get empty params.
+PARAM_PARSERS: dict[str, tuple[int, Callable[[List[str]], dict]]] = {
+    "PlayerHurt": (6, _parse_player_hurt),
+    "PlayerShootWeapon": (2, lambda parts: {"weapon": parts[1]}),
+    "PlayerDeath": (2, lambda parts: {"damagebits": int(parts[1]) if parts[1].isdigit() else 0}),
+    "PlayerHealth": (2, lambda parts: {"health": int(parts[1]) if parts[1].isdigit() else 100}),
+    "PlayerHeal": (2, _parse_player_heal),
+    "PrimaryHandChanged": (2, lambda parts: {"is_primary_left": parts[1].lower() == "true"}),
+    "ItemPickup": (3, lambda parts: {"item": parts[1], "left_shoulder": parts[2] == "1"}),
+    "ItemReleased": (3, lambda parts: {"item": parts[1], "left_hand_used": parts[2] == "1"}),
+    "PlayerShotgunUpgradeGrenadeLauncherState": (
+        2, lambda parts: {"state": int(parts[1]) if parts[1].isdigit() else 0}
+    ),
+    **{event: (2, _parse_hand) for event in HAND_EVENTS},
+    **{event: (2, _parse_side) for event in SIDE_EVENTS},
+}
 
 
 def parse_tactsuit_line(line: str) -> Optional[AlyxEvent]:
@@ -77,46 +134,12 @@ def parse_tactsuit_line(line: str) -> Optional[AlyxEvent]:
         return None
     
     event_type = parts[0]
-    params = {}
     
     # Parse parameters based on event type
-    if event_type == "PlayerHurt" and len(parts) >= 6:
-        params = {
-            "health": int(parts[1]) if parts[1].isdigit() else 100,
-            "enemy_class": parts[2],
-            "angle": float(parts[3]) if parts[3].replace('.', '').isdigit() else 0.0,
-            "enemy_name": parts[4],
-            "enemy_debug_name": parts[5],
-        }
-    elif event_type == "PlayerShootWeapon" and len(parts) >= 2:
-        params = {"weapon": parts[1]}
-    elif event_type == "PlayerDeath" and len(parts) >= 2:
-        params = {"damagebits": int(parts[1]) if parts[1].isdigit() else 0}
-    elif event_type == "PlayerHealth" and len(parts) >= 2:
-        params = {"health": int(parts[1]) if parts[1].isdigit() else 100}
-    elif event_type == "PlayerHeal" and len(parts) >= 2:
-        params = {"angle": float(parts[1]) if parts[1].replace('.', '').replace('-', '').isdigit() else 0.0}
-    elif event_type in ("PlayerGrabbityPull", "PlayerGrabbityLockStart", "PlayerGrabbityLockStop",
-                         "GrabbityGloveCatch") and len(parts) >= 2:
-        params = {"is_primary_hand": parts[1].lower() == "true"}
-    elif event_type in ("PlayerDropAmmoInBackpack", "PlayerDropResinInBackpack",
-                         "PlayerRetrievedBackpackClip", "PlayerStoredItemInItemholder",
-                         "PlayerRemovedItemFromItemholder", "PlayerUsingHealthstation") and len(parts) >= 2:
-        params = {"left_side": parts[1] == "1"}
-    elif event_type == "PrimaryHandChanged" and len(parts) >= 2:
-        params = {"is_primary_left": parts[1].lower() == "true"}
-    elif event_type == "ItemPickup" and len(parts) >= 3:
-        params = {"item": parts[1], "left_shoulder": parts[2] == "1"}
-    elif event_type == "ItemReleased" and len(parts) >= 3:
-        params = {"item": parts[1], "left_hand_used": parts[2] == "1"}
-    elif event_type == "PlayerShotgunUpgradeGrenadeLauncherState" and len(parts) >= 2:
-        params = {"state": int(parts[1]) if parts[1].isdigit() else 0}
-    # Events with no params
-    elif event_type in ("PlayerGrabbedByBarnacle", "PlayerReleasedByBarnacle",
-                         "PlayerCoughStart", "PlayerCoughEnd", "TwoHandStart", "TwoHandEnd",
-                         "PlayerOpenedGameMenu", "PlayerClosedGameMenu", "Reset",
-                         "PlayerPistolClipInserted", "PlayerPistolChamberedRound",
-                         "PlayerShotgunShellLoaded", "PlayerShotgunLoadedShells"):
+    parser = PARAM_PARSERS.get(event_type)
+    if parser is not None and len(parts) >= parser[0]:
+        params = parser[1](parts)
+    else:
         params = {}
     
     return AlyxEvent(type=event_type, raw=content, params=params)
@@ -126,6 +149,15 @@ def parse_tactsuit_line(line: str) -> Optional[AlyxEvent]:
 # Haptic Mapper (Phase 3)
 # =============================================================================
 
+# Cells per 90° sector: front, left, back, right (see angle_to_cells)
+_SECTOR_CELLS = (
+    [Cell.FRONT_UPPER_LEFT, Cell.FRONT_UPPER_RIGHT],  # 315-45°
+    LEFT_SIDE,                                        # 45-135°
+    BACK_CELLS,                                       # 135-225°
+    RIGHT_SIDE,                                       # 225-315°
+)
+
+
 def angle_to_cells(angle: float) -> List[int]:
     """
     Convert damage angle (0-360°) to vest cells.
@@ -145,21 +177,9 @@ def angle_to_cells(angle: float) -> List[int]:
       └─────┴─────┘          └─────┴─────┘
         L     R                L     R
     """
-    # Normalize angle to 0-360
-    angle = angle % 360
-    
-    if angle < 45 or angle >= 315:
-        # Front upper cells
-        return [Cell.FRONT_UPPER_LEFT, Cell.FRONT_UPPER_RIGHT]
-    elif 45 <= angle < 135:
-        # Left side (from player perspective)
-        return LEFT_SIDE
-    elif 135 <= angle < 225:
-        # Back
-        return BACK_CELLS
-    else:  # 225 <= angle < 315
-        # Right side
-        return RIGHT_SIDE
+    # Normalize angle to 0-360, then shift by 45° so each 90° sector maps to
+    # one integer bucket (315° wraps around to front)
+    return _SECTOR_CELLS[int((angle % 360 + 45) // 90) % 4]
 
 
 def map_event_to_haptics(event: AlyxEvent) -> List[tuple[int, int]]:
@@ -211,20 +231,23 @@ class ConsoleLogWatcher:
     """
     
     DEFAULT_POLL_INTERVAL = 0.05  # 50ms
+    MAX_POLL_INTERVAL = 0.5  # Ceiling while the log is idle
     
     def __init__(
         self,
         log_path: Path,
         on_event: Callable[[AlyxEvent], None],
         poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = MAX_POLL_INTERVAL,
     ):
         self.log_path = log_path
         self.on_event = on_event
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
         
         self._running = False
-        self._last_position = 0
         self._thread: Optional[Thread] = None
+        self._tailer: Optional[LogTailer] = None
     
     def start(self) -> tuple[bool, Optional[str]]:
         """Start watching the console log."""
@@ -235,7 +258,8 @@ class ConsoleLogWatcher:
             return False, f"Console log not found: {self.log_path}"
         
         self._running = True
-        self._last_position = self.log_path.stat().st_size  # Start from end
+        # Start from end
+        self._tailer = LogTailer(self.log_path, position=self.log_path.stat().st_size)
         
         self._thread = Thread(target=self._watch_loop, daemon=True)
         self._thread.start()
@@ -249,51 +273,41 @@ class ConsoleLogWatcher:
         if self._thread:
             self._thread.join(timeout=1.0)
             self._thread = None
+        if self._tailer:
+            self._tailer.close()
         logger.info("Stopped watching console log")
     
     def _watch_loop(self):
         """Main watch loop running in background thread."""
+        interval = self.poll_interval
         while self._running:
+            active = False
             try:
-                self._check_for_new_lines()
-            except FileNotFoundError:
-                # Log file may be deleted/recreated
-                self._last_position = 0
+                active = self._check_for_new_lines()
             except Exception as e:
                 logger.error(f"Error reading console log: {e}")
             
-            time.sleep(self.poll_interval)
-    
-    def _check_for_new_lines(self):
-        """Check for new lines in the console log."""
-        if not self.log_path.exists():
-            return
-        
-        current_size = self.log_path.stat().st_size
-        
-        # Handle log truncation (game restart)
-        if current_size < self._last_position:
-            logger.info("Console log truncated, resetting position")
-            self._last_position = 0
+            # Back off while the log is idle, snap back as soon as it grows
+            if active:
+                interval = self.poll_interval
+            else:
+                interval = min(interval * 1.5, self.max_poll_interval)
+            time.sleep(interval)
+    
+    def _check_for_new_lines(self) -> bool:
+        """Check for new lines in the console log; returns True if it grew."""
+        lines = self._tailer.read_lines()
+        if lines is None:
+            return False
         
-        if current_size == self._last_position:
-            return
+        # Only decode the lines emitted by the mod
+        for raw in lines:
+            if TACTSUIT_MARKER in raw:
+                event = parse_tactsuit_line(raw.decode('utf-8', errors='ignore'))
+                if event:
+                    self.on_event(event)
         
-        try:
-            with open(self.log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                f.seek(self._last_position)
-                new_content = f.read()
-                self._last_position = f.tell()
-            
-            for line in new_content.splitlines():
-                if "[Tactsuit]" in line:
-                    event = parse_tactsuit_line(line)
-                    if event:
-                        self.on_event(event)
-        
-        except IOError as e:
-            # File may be locked by game
-            logger.debug(f"IOError reading log (game may have lock): {e}")
+        return True
 
 
 # =============================================================================
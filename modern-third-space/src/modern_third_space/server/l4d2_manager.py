@@ -21,6 +21,7 @@ from pathlib import Path
 from threading import Thread
 from typing import Callable, Optional, List, Tuple
 
+from .log_tailer import LogTailer
 from ..vest.cell_layout import (
     Cell,
     FRONT_CELLS,
@@ -39,7 +40,7 @@ logger = logging.getLogger(__name__)
 # Event Parser
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class L4D2Event:
     """Parsed event from Left 4 Dead 2 console.log."""
     type: str  # "player_damage", "player_death", "weapon_fire", "health_pickup", etc.
@@ -119,6 +120,19 @@ HAPTICS_MOD_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Lowercase substrings at least one of which every pattern above requires.
+# Most console.log lines contain none of them and skip all regex work.
+EVENT_KEYWORDS = (
+    "[l4d2haptics]",
+    "killed by",
+    "died",
+    "damage",
+    "fired",
+    "picked up",
+    "spawn",
+    "attacked",
+)
+
 
 def parse_console_line(line: str, player_name: Optional[str] = None) -> Optional[L4D2Event]:
     """
@@ -143,6 +157,9 @@ def parse_console_line(line: str, player_name: Optional[str] = None) -> Optional
     
     line_lower = line.lower()
     
+    if not any(keyword in line_lower for keyword in EVENT_KEYWORDS):
+        return None
+    
     # Phase 2: Check for structured mod output first (most reliable)
     # Format: [L4D2Haptics] {EventType|param1|param2|...}
     match = HAPTICS_MOD_PATTERN.search(line)
@@ -530,6 +547,7 @@ class ConsoleLogWatcher:
     """
     
     DEFAULT_POLL_INTERVAL = 0.05  # 50ms
+    MAX_POLL_INTERVAL = 0.5  # Ceiling while the log is idle
     
     def __init__(
         self,
@@ -537,15 +555,17 @@ class ConsoleLogWatcher:
         on_event: Callable[[L4D2Event], None],
         player_name: Optional[str] = None,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = MAX_POLL_INTERVAL,
     ):
         self.log_path = log_path
         self.on_event = on_event
         self.player_name = player_name
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
         
         self._running = False
-        self._last_position = 0
         self._thread: Optional[Thread] = None
+        self._tailer: Optional[LogTailer] = None
     
     def start(self) -> tuple[bool, Optional[str]]:
         """Start watching the console log."""
@@ -556,7 +576,8 @@ class ConsoleLogWatcher:
             return False, f"Console log not found: {self.log_path}"
         
         self._running = True
-        self._last_position = self.log_path.stat().st_size  # Start from end
+        # Start from end
+        self._tailer = LogTailer(self.log_path, position=self.log_path.stat().st_size)
         
         self._thread = Thread(target=self._watch_loop, daemon=True)
         self._thread.start()
@@ -570,54 +591,43 @@ class ConsoleLogWatcher:
         if self._thread:
             self._thread.join(timeout=1.0)
             self._thread = None
+        if self._tailer:
+            self._tailer.close()
         logger.info("Stopped watching L4D2 console.log")
     
     def _watch_loop(self):
         """Main watch loop running in background thread."""
+        interval = self.poll_interval
         while self._running:
+            active = False
             try:
-                self._check_for_new_lines()
-            except FileNotFoundError:
-                # Log file may be deleted/recreated
-                self._last_position = 0
+                active = self._check_for_new_lines()
             except Exception as e:
                 logger.error(f"Error reading L4D2 console log: {e}")
             
-            time.sleep(self.poll_interval)
-    
-    def _check_for_new_lines(self):
-        """Check for new lines in the console log."""
-        if not self.log_path.exists():
-            return
-        
-        current_size = self.log_path.stat().st_size
-        
-        # Handle log truncation (game restart)
-        if current_size < self._last_position:
-            logger.info("L4D2 console log truncated, resetting position")
-            self._last_position = 0
+            # Back off while the log is idle, snap back as soon as it grows
+            if active:
+                interval = self.poll_interval
+            else:
+                interval = min(interval * 1.5, self.max_poll_interval)
+            time.sleep(interval)
+    
+    def _check_for_new_lines(self) -> bool:
+        """Check for new lines in the console log; returns True if it grew."""
+        lines = self._tailer.read_lines()
+        if lines is None:
+            return False
         
-        if current_size == self._last_position:
-            return
+        for raw in lines:
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if line:
+                logger.info(f"[L4D2 LOG] {line}")
+            event = parse_console_line(line, self.player_name)
+            if event:
+                logger.info(f"[L4D2 PARSED] {event.type}: {event.params}")
+                self.on_event(event)
         
-        try:
-            with open(self.log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                f.seek(self._last_position)
-                new_content = f.read()
-                self._last_position = f.tell()
-            
-            for line in new_content.splitlines():
-                line = line.strip()
-                if line:
-                    logger.info(f"[L4D2 LOG] {line}")
-                event = parse_console_line(line, self.player_name)
-                if event:
-                    logger.info(f"[L4D2 PARSED] {event.type}: {event.params}")
-                    self.on_event(event)
-        
-        except IOError as e:
-            # File may be locked by game
-            logger.debug(f"IOError reading L4D2 console log (game may have lock): {e}")
+        return True
 
 
 # =============================================================================
@@ -61,6 +61,24 @@ def read_pid_file(port: int = DEFAULT_PORT) -> Optional[int]:
         return None
 
 
+def find_running_daemon_ports() -> list[int]:
+    """
+    Find the ports of daemons that have a PID file and are still running.
+    
+    Lets clients reach a daemon started with a non-default --port.
+    """
+    ports = []
+    for pid_file in Path(tempfile.gettempdir()).glob("vest-daemon-*.pid"):
+        try:
+            port = int(pid_file.stem.removeprefix("vest-daemon-"))
+        except ValueError:
+            continue
+        pid = read_pid_file(port)
+        if pid is not None and is_process_running(pid):
+            ports.append(port)
+    return sorted(ports)
+
+
 def remove_pid_file(port: int = DEFAULT_PORT) -> None:
     """
     Remove the PID file.
@@ -105,6 +123,40 @@ def is_process_running(pid: int) -> bool:
         return False
 
 
+def wait_for_process_exit(pid: int, timeout: float = 1.0) -> bool:
+    """
+    Wait up to timeout seconds for a process to exit.
+    
+    On Linux a pidfd becomes readable the moment the process exits, so the
+    wait returns immediately; elsewhere is_process_running is polled.
+    
+    Returns True if the process exited.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pidfd = None  # e.g. kernel without pidfd support; poll instead
+        
+        if pidfd is not None:
+            import select
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(pidfd)
+    
+    import time
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        if not is_process_running(pid):
+            return True
+    return False
+
+
 def is_port_in_use(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> bool:
     """
     Check if the given port is in use.
@@ -180,12 +232,9 @@ def stop_daemon(
         os.kill(pid, sig)
         
         # Wait a moment for process to exit
-        import time
-        for _ in range(10):
-            time.sleep(0.1)
-            if not is_process_running(pid):
-                remove_pid_file(port)
-                return (True, f"Daemon stopped (PID {pid})")
+        if wait_for_process_exit(pid, timeout=1.0):
+            remove_pid_file(port)
+            return (True, f"Daemon stopped (PID {pid})")
         
         if force:
             remove_pid_file(port)
@@ -220,18 +269,18 @@ def ping_daemon(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> Tuple[boo
         sock.sendall(b'{"cmd": "ping"}\n')
         
         # Read responses (may have multiple lines - client_connected event + ping response)
-        response = b""
-        start_time = time.time()
-        while time.time() - start_time < 3:  # 3 second timeout
+        pending = b""  # Incomplete trailing line carried into the next recv
+        deadline = time.monotonic() + 3  # 3 second timeout
+        while time.monotonic() < deadline:
             try:
                 sock.settimeout(0.5)
                 chunk = sock.recv(4096)
                 if not chunk:
                     break
-                response += chunk
                 
-                # Check if we have the ping response
-                lines = response.decode().strip().split("\n")
+                # Check the newly completed lines for the ping response; earlier
+                # lines were already checked, so nothing is re-decoded
+                *lines, pending = (pending + chunk).split(b"\n")
                 for line in lines:
                     try:
                         data = json.loads(line)
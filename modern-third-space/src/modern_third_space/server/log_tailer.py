@@ -0,0 +1,116 @@
+"""
+Incremental reader for game console logs.
+
+Shared by the console.log watchers (Half-Life: Alyx, Left 4 Dead 2): each
+poll returns only the complete lines appended since the previous poll,
+following the log across truncation, replacement and deletion.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LogTailer:
+    """
+    Follows a log file and returns the complete lines appended to it.
+    
+    - A file that shrinks (truncated) or gets a new inode (replaced) is
+      read again from the top.
+    - A missing file is waited for and then read from the top.
+    - An unterminated trailing line is held back until it is finished.
+    
+    Lines are returned as raw bytes so callers only decode the ones they
+    care about; "\\n" never occurs inside a UTF-8 multibyte sequence, so
+    each line decodes on its own.
+    
+    Args:
+        path: Log file to follow
+        position: Byte offset to start reading from (e.g. the current size
+                  to skip existing content)
+        keep_open: Hold the file handle between polls. Off by default on
+                   Windows, where an open handle (no FILE_SHARE_DELETE)
+                   stops the game from deleting or rotating its log.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        position: int = 0,
+        keep_open: bool = os.name != "nt",
+    ):
+        self.path = path
+        self.position = position
+        self.keep_open = keep_open
+        
+        self._file: Optional[BinaryIO] = None
+        self._inode: Optional[int] = None
+        self._pending = b""
+    
+    def read_lines(self) -> Optional[List[bytes]]:
+        """
+        Return the complete lines appended since the last call.
+        
+        Returns None if the file did not grow (or is missing/unreadable),
+        otherwise the new lines, which may be empty when only part of a
+        line was written.
+        """
+        # A single stat() per poll
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # Deleted (or not created yet), read the next one from the top
+            self._restart(0)
+            self._inode = None
+            return None
+        
+        if self._inode is None:
+            self._inode = st.st_ino
+        elif st.st_ino != self._inode:
+            logger.info(f"Log replaced, reading from the start: {self.path}")
+            self._restart(0)
+            self._inode = st.st_ino
+        elif st.st_size < self.position:
+            logger.info(f"Log truncated, resetting position: {self.path}")
+            self._restart(0)
+        
+        if st.st_size == self.position:
+            return None
+        
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'rb')
+                self._file.seek(self.position)
+            data = self._file.read()
+        except OSError as e:
+            # File may be locked by the game
+            logger.debug(f"Could not read log (game may have lock): {e}")
+            self.close()
+            return None
+        finally:
+            if not self.keep_open:
+                self.close()
+        
+        self.position += len(data)
+        
+        # Keep an unterminated trailing line until the game finishes it
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+        return lines
+    
+    def close(self):
+        """Close the held file handle, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _restart(self, position: int):
+        """Drop the handle and any partial line, continue at ``position``."""
+        self.close()
+        self.position = position
+        self._pending = b""
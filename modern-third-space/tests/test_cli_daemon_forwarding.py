@@ -0,0 +1,145 @@
+"""
+Tests for forwarding CLI trigger/stop commands to a running daemon.
+
+A loopback fake daemon stands in for the real one, so these tests never
+touch USB.
+
+Run with: pytest tests/test_cli_daemon_forwarding.py -v
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from modern_third_space import cli
+
+
+class FakeDaemon:
+    """Accepts one client, records its command and replies with ``reply(cmd)``."""
+    
+    def __init__(self, reply):
+        self.reply = reply
+        self.commands = []
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        self._release = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+    
+    def _serve(self):
+        conn, _ = self._server.accept()
+        with conn, conn.makefile("rb") as stream:
+            command = json.loads(stream.readline())
+            self.commands.append(command)
+            conn.sendall(self.reply(command))
+            # Keep the connection open (like the real daemon) until the test ends
+            self._release.wait(5)
+    
+    def close(self):
+        self._release.set()
+        self._thread.join(timeout=5)
+        self._server.close()
+
+
+@pytest.fixture
+def fake_daemon():
+    daemons = []
+    
+    def start(reply):
+        daemon = FakeDaemon(reply)
+        daemons.append(daemon)
+        return daemon
+    
+    yield start
+    for daemon in daemons:
+        daemon.close()
+
+
+def unused_port() -> int:
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[1]
+
+
+def trigger_args(port, cell=2, speed=5):
+    return cli.build_parser("trigger").parse_args(
+        ["trigger", "--cell", str(cell), "--speed", str(speed), "--daemon-port", str(port)]
+    )
+
+
+def response(command, **fields):
+    data = {"response": "ok", "req_id": command["req_id"], **fields}
+    return (json.dumps(data) + "\n").encode()
+
+
+class TestForwardVestCommand:
+    """trigger/stop go through a running daemon and print the local JSON."""
+    
+    def test_trigger_ok(self, fake_daemon, capsys):
+        # An event broadcast and non-dict JSON arrive before the response
+        daemon = fake_daemon(
+            lambda cmd: b'{"event": "client_connected"}\n[1, 2]\nnot json\n' + response(cmd)
+        )
+        
+        assert cli._forward_vest_command("trigger", trigger_args(daemon.port)) == 0
+        assert json.loads(capsys.readouterr().out) == {"success": True, "cell": 2, "speed": 5}
+        assert daemon.commands == [{"cmd": "trigger", "cell": 2, "speed": 5, "req_id": "cli"}]
+    
+    def test_stop_ok(self, fake_daemon, capsys):
+        daemon = fake_daemon(response)
+        args = cli.build_parser("stop").parse_args(["stop", "--daemon-port", str(daemon.port)])
+        
+        assert cli._forward_vest_command("stop", args) == 0
+        assert capsys.readouterr().out == cli.STOP_RESPONSE
+        assert daemon.commands[0]["cmd"] == "stop"
+    
+    def test_error_response(self, fake_daemon, capsys):
+        daemon = fake_daemon(
+            lambda cmd: response(cmd, response="error", message="No device connected")
+        )
+        
+        assert cli._forward_vest_command("trigger", trigger_args(daemon.port)) == 1
+        assert json.loads(capsys.readouterr().out) == {
+            "success": False,
+            "error": "No device connected",
+        }
+    
+    def test_silent_daemon_times_out(self, fake_daemon, capsys, monkeypatch):
+        monkeypatch.setattr(cli, "DAEMON_REPLY_TIMEOUT", 0.2)
+        # Keeps sending unrelated events but never answers the command
+        daemon = fake_daemon(lambda cmd: b'{"event": "tick"}\n')
+        
+        assert cli._forward_vest_command("trigger", trigger_args(daemon.port)) == 1
+        output = json.loads(capsys.readouterr().out)
+        assert output["success"] is False
+        assert output["error"] == f"Daemon at 127.0.0.1:{daemon.port} did not respond within 0.2s"
+    
+    def test_refused_falls_back_to_local(self, capsys):
+        assert cli._forward_vest_command("trigger", trigger_args(unused_port())) is None
+        assert capsys.readouterr().out == ""
+    
+    def test_other_commands_are_not_forwarded(self):
+        assert cli._forward_vest_command("status", cli.argparse.Namespace(command="status")) is None
+
+
+class TestDaemonDiscovery:
+    """Without --daemon-port, daemons on other ports are found by PID file."""
+    
+    def test_finds_daemon_by_pid_file(self, fake_daemon, capsys, monkeypatch, tmp_path):
+        from modern_third_space.server import lifecycle
+        
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        daemon = fake_daemon(response)
+        lifecycle.get_pid_file_path(daemon.port).write_text(str(os.getpid()))
+        # A stale PID file for a port nobody listens on is skipped
+        lifecycle.get_pid_file_path(unused_port()).write_text("999999999")
+        monkeypatch.setattr(lifecycle, "DEFAULT_PORT", unused_port())
+        
+        args = cli.build_parser("stop").parse_args(["stop"])
+        assert args.daemon_port is None
+        assert cli._daemon_ports(args) == [lifecycle.DEFAULT_PORT, daemon.port]
+        assert cli._forward_vest_command("stop", args) == 0
+        assert capsys.readouterr().out == cli.STOP_RESPONSE
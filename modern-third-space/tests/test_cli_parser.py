@@ -0,0 +1,75 @@
+"""
+Tests for the CLI's per-subcommand argument parsers.
+
+main() builds only the parser for the subcommand being run. These tests
+check it parses exactly like the full parser, and that errors still go
+through the full parser.
+
+Run with: pytest tests/test_cli_parser.py -v
+"""
+
+import pytest
+
+from modern_third_space import cli
+
+
+# At least one argv per subcommand, including nested actions and defaults
+ARGVS = [
+    ["status"],
+    ["effects"],
+    ["effects", "--pretty"],
+    ["trigger", "--cell", "3", "--speed", "7"],
+    ["trigger", "--cell", "0", "--speed", "1", "--daemon-host", "10.0.0.2", "--daemon-port", "5051"],
+    ["stop"],
+    ["stop", "--daemon-port", "5052"],
+    ["ping"],
+    ["list"],
+    ["list", "--pretty"],
+    ["connect"],
+    ["connect", "--bus", "1", "--address", "5"],
+    ["connect", "--serial", "ABC"],
+    ["daemon"],
+    ["daemon", "start", "--port", "5051"],
+    ["daemon", "stop", "--force"],
+    ["daemon", "status", "--host", "localhost"],
+    ["cs2"],
+    ["cs2", "start", "--gsi-port", "3001", "--daemon-port", "5050"],
+    ["cs2", "generate-config", "-o", "out.cfg"],
+    ["cs2", "status", "--daemon-host", "localhost"],
+]
+
+
+class TestSubcommandParsers:
+    """The single-subcommand parser and the full parser agree."""
+    
+    def test_every_subcommand_is_covered(self):
+        assert {argv[0] for argv in ARGVS} == set(cli.SUBCOMMANDS)
+    
+    @pytest.mark.parametrize("argv", ARGVS, ids=" ".join)
+    def test_same_namespace_as_full_parser(self, argv):
+        single, extras = cli.build_parser(argv[0]).parse_known_args(argv)
+        assert extras == []
+        assert single == cli.build_parser(None).parse_args(argv)
+    
+    def test_unknown_commands_share_the_full_parser(self):
+        full = cli.build_parser(None)
+        assert cli.build_parser() is full
+        assert cli.build_parser("tirgger") is full
+        assert cli.build_parser("--help") is full
+        assert cli.build_parser("trigger") is not full
+    
+    def test_unknown_option_is_reported_by_full_parser(self, capsys):
+        with pytest.raises(SystemExit) as exc:
+            cli.main(["ping", "--bogus"])
+        assert exc.value.code == 2
+        
+        err = capsys.readouterr().err
+        assert "unrecognized arguments: --bogus" in err
+        # The usage line comes from the full parser, listing every command
+        assert "{" + ",".join(cli.SUBCOMMANDS) + "}" in err
+    
+    def test_unknown_command_is_reported_by_full_parser(self, capsys):
+        with pytest.raises(SystemExit) as exc:
+            cli.main(["tirgger"])
+        assert exc.value.code == 2
+        assert "invalid choice: 'tirgger'" in capsys.readouterr().err
@@ -0,0 +1,141 @@
+"""
+Tests for LogTailer, the console.log reader shared by the log file watchers.
+
+Every scenario runs with the handle held open between polls (the default
+on Linux/macOS) and closed after each poll (the default on Windows).
+
+Run with: pytest tests/test_log_tailer.py -v
+"""
+
+import os
+
+import pytest
+
+from modern_third_space.server.log_tailer import LogTailer
+
+
+@pytest.fixture(params=[True, False], ids=["keep_open", "reopen"])
+def keep_open(request):
+    return request.param
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "console.log"
+    path.write_bytes(b"old line\n")
+    return path
+
+
+def append(path, data: bytes):
+    with open(path, "ab") as f:
+        f.write(data)
+
+
+class TestLogTailer:
+    """Lines appended between polls are returned once, across file changes."""
+    
+    def test_starts_at_given_position(self, log_path, keep_open):
+        tailer = LogTailer(log_path, position=log_path.stat().st_size, keep_open=keep_open)
+        assert tailer.read_lines() is None
+        
+        append(log_path, b"first\nsecond\n")
+        assert tailer.read_lines() == [b"first", b"second"]
+        assert tailer.read_lines() is None
+        tailer.close()
+    
+    def test_partial_line_completed_on_next_poll(self, log_path, keep_open):
+        tailer = LogTailer(log_path, position=log_path.stat().st_size, keep_open=keep_open)
+        
+        append(log_path, b"[Tactsuit] {Player")
+        assert tailer.read_lines() == []
+        
+        append(log_path, "Hurt|80|é}\nnext".encode("utf-8"))
+        assert tailer.read_lines() == ["[Tactsuit] {PlayerHurt|80|é}".encode("utf-8")]
+        
+        append(log_path, b"\n")
+        assert tailer.read_lines() == [b"next"]
+        tailer.close()
+    
+    def test_truncation_reads_from_start(self, log_path, keep_open):
+        tailer = LogTailer(log_path, position=log_path.stat().st_size, keep_open=keep_open)
+        
+        append(log_path, b"partial")
+        assert tailer.read_lines() == []
+        
+        with open(log_path, "r+b") as f:
+            f.truncate(0)
+        append(log_path, b"new\n")
+        
+        # The partial line from before the truncation is dropped
+        assert tailer.read_lines() == [b"new"]
+        tailer.close()
+    
+    def test_replaced_file_reads_from_start(self, log_path, tmp_path, keep_open):
+        tailer = LogTailer(log_path, position=log_path.stat().st_size, keep_open=keep_open)
+        assert tailer.read_lines() is None
+        
+        # Bigger than the old file, so only the inode change gives it away
+        replacement = tmp_path / "console.log.new"
+        replacement.write_bytes(b"restart 1\nrestart 2\n")
+        os.replace(replacement, log_path)
+        
+        assert tailer.read_lines() == [b"restart 1", b"restart 2"]
+        tailer.close()
+    
+    def test_missing_file_is_read_once_it_appears(self, tmp_path, keep_open):
+        path = tmp_path / "console.log"
+        tailer = LogTailer(path, keep_open=keep_open)
+        assert tailer.read_lines() is None
+        
+        path.write_bytes(b"hello\n")
+        assert tailer.read_lines() == [b"hello"]
+        
+        path.unlink()
+        assert tailer.read_lines() is None
+        
+        path.write_bytes(b"again\n")
+        assert tailer.read_lines() == [b"again"]
+        tailer.close()
+    
+    def test_handle_only_held_when_keep_open(self, log_path, keep_open):
+        tailer = LogTailer(log_path, keep_open=keep_open)
+        assert tailer.read_lines() == [b"old line"]
+        assert (tailer._file is not None) == keep_open
+        
+        tailer.close()
+        assert tailer._file is None
+    
+    def test_default_closes_between_polls_on_windows(self, log_path):
+        assert LogTailer(log_path).keep_open == (os.name != "nt")
+
+
+class TestConsoleLogWatchers:
+    """Both console.log watchers turn appended lines into events."""
+    
+    def test_alyx_watcher_emits_tactsuit_events(self, log_path):
+        from modern_third_space.server.alyx_manager import ConsoleLogWatcher
+        
+        events = []
+        watcher = ConsoleLogWatcher(log_path, events.append)
+        watcher._tailer = LogTailer(log_path, position=log_path.stat().st_size)
+        
+        append(log_path, b"noise\n[Tactsuit] {PlayerDeath|4}\n")
+        assert watcher._check_for_new_lines() is True
+        assert [(e.type, e.params) for e in events] == [("PlayerDeath", {"damagebits": 4})]
+        assert watcher._check_for_new_lines() is False
+        watcher.stop()
+    
+    def test_l4d2_watcher_passes_every_line(self, log_path, monkeypatch):
+        from modern_third_space.server import l4d2_manager
+        
+        seen = []
+        monkeypatch.setattr(
+            l4d2_manager, "parse_console_line", lambda line, player: seen.append(line)
+        )
+        watcher = l4d2_manager.ConsoleLogWatcher(log_path, lambda event: None)
+        watcher._tailer = LogTailer(log_path, position=log_path.stat().st_size)
+        
+        append(log_path, b"one\r\ntwo\n")
+        assert watcher._check_for_new_lines() is True
+        assert seen == ["one", "two"]
+        watcher.stop()